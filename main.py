@@ -1,6 +1,9 @@
 import sys
 import os
+import math
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QLabel, 
                            QVBoxLayout, QHBoxLayout, QWidget, QFileDialog, 
                            QProgressBar, QTableWidget, QTableWidgetItem, QMessageBox)
@@ -9,49 +12,356 @@ from PyQt5.QtGui import QIcon
 from PyQt5.QtWinExtras import QtWin
 import cv2
 import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+from torchvision import transforms
+from torchvision.io import read_file, decode_jpeg, ImageReadMode
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+NCC_BLOCK = 2048  # Elements per partial-sum block in the bounded kernel
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _ncc_kernel(query, candidate):
+        """Correlate a mean-centered unit query against a raw candidate
+
+        The query is already normalized, so only the candidate's mean and
+        norm are computed here; fastmath lets the compiler vectorize the
+        accumulation loops.
+        """
+        n = candidate.size
+        mean = 0.0
+        for i in range(n):
+            mean += candidate[i]
+        mean /= n
+
+        num = 0.0
+        den = 0.0
+        for i in range(n):
+            d = candidate[i] - mean
+            num += query[i] * d
+            den += d * d
+
+        return num / (math.sqrt(den) + 1e-8)
+
+    @njit(cache=True, fastmath=True)
+    def _ncc_bounded(query, candidate, query_tails, cand_tails, best_score):
+        """Blocked NCC over unit vectors with Cauchy-Schwarz early exit
+
+        Both vectors are mean-centered and unit-norm. After each block
+        the unseen suffix can contribute at most the product of the two
+        suffix norms, so a candidate whose bound already falls below the
+        running best score bails out with the -1.0 sentinel.
+        """
+        n = candidate.size
+        nblocks = cand_tails.size
+        partial = 0.0
+        for b in range(nblocks):
+            start = b * NCC_BLOCK
+            end = start + NCC_BLOCK
+            if end > n:
+                end = n
+            for i in range(start, end):
+                partial += query[i] * candidate[i]
+
+            if b + 1 < nblocks:
+                bound = partial + query_tails[b + 1] * cand_tails[b + 1]
+                if (bound + 1) / 2 < best_score:
+                    return -1.0
+
+        return partial
 
 
 class ImageProcessor(QThread):
     progress_updated = pyqtSignal(int)
     result_found = pyqtSignal(str, float)
-    comparison_update = pyqtSignal(str, float)
+    comparison_update = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
-    
-    def __init__(self, modified_image_path, folder_path, output_folder):
+
+    _simd_checked = False
+
+    CACHE_FILENAME = '.sbi_phash_cache.npz'
+    FEATURES_FILENAME = '.sbi_ncc_features.dat'
+    MANIFEST_FILENAME = '.sbi_ncc_manifest.npz'
+    UPDATE_BATCH = 32  # Comparison results per cross-thread signal
+
+    def __init__(self, executor=None):
         super().__init__()
+        self.modified_image_path = None
+        self.folder_path = None
+        self.output_folder = None
+        self.method = 'phash'  # 'phash' (fast) or 'ncc' (pixel-wise)
+        self.target_size = (224, 224)  # Standard size for comparison
+        self._query_norm = None  # Normalized query vector, cached by run()
+        self._scratch = threading.local()  # Per-worker cv2 output buffers
+
+        # The pool outlives individual searches, so repeat runs skip the
+        # worker teardown/spin-up cost
+        self._executor = executor or ThreadPoolExecutor(max_workers=8)
+
+        # Let OpenCV parallelize its kernels, keeping one core for the GUI
+        cv2.setNumThreads(max(1, os.cpu_count() - 1))
+
+        # Warn once if the installed wheel was built without AVX2 dispatch
+        if not ImageProcessor._simd_checked:
+            ImageProcessor._simd_checked = True
+            if 'AVX2' not in cv2.getBuildInformation():
+                print("Warning: OpenCV build lacks AVX2 dispatch; "
+                      "resize/DCT kernels will run without SIMD acceleration")
+
+        # Trigger JIT compilation outside the hot loop
+        if NUMBA_AVAILABLE:
+            warmup = np.zeros(8, dtype=np.float32)
+            tails = np.zeros(1, dtype=np.float32)
+            _ncc_kernel(warmup, warmup)
+            _ncc_bounded(warmup, warmup, tails, tails, -1.0)
+
+    def configure(self, modified_image_path, folder_path, output_folder, method='phash'):
+        """Set the parameters for the next search"""
         self.modified_image_path = modified_image_path
         self.folder_path = folder_path
         self.output_folder = output_folder
-        self.target_size = (224, 224)  # Standard size for comparison
+        self.method = method
+        self._query_norm = None
+
+    def _list_image_files(self):
+        """List full paths of supported images, excluding the query file
+
+        scandir yields DirEntry objects whose is_file() check uses the
+        stat info prefetched during iteration, and returning entry paths
+        directly saves a join per candidate later. The query is resolved
+        to a real path once, so the scoring loops never pay a
+        per-candidate filesystem check.
+        """
+        supported_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
+        query_path = os.path.normcase(os.path.realpath(self.modified_image_path))
+        with os.scandir(self.folder_path) as entries:
+            return [e.path for e in entries
+                    if e.is_file()
+                    and e.name.lower().endswith(supported_extensions)
+                    and os.path.normcase(os.path.realpath(e.path)) != query_path]
+
+    def compute_phash(self, image_path):
+        """Compute a 64-bit DCT-based perceptual hash of an image"""
+        try:
+            img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            if img is None:
+                return None
+
+            # Low frequencies of the DCT capture the image structure;
+            # thresholding the top-left 8x8 block at its median gives a
+            # compact 64-bit fingerprint
+            img = cv2.resize(img, (32, 32), interpolation=cv2.INTER_AREA)
+            dct = cv2.dct(img.astype(np.float32))
+            block = dct[:8, :8].ravel()
+            bits = block > np.median(block)
+
+            return np.packbits(bits).view(np.uint64)[0]
+        except Exception as e:
+            self.error_occurred.emit(f"Error hashing image {image_path}: {str(e)}")
+            return None
+
+    def _load_or_build_hashes(self, full_paths):
+        """Get candidate hashes, reusing the on-disk cache where possible
+
+        The cache maps (absolute path, mtime_ns, size) to the 64-bit hash,
+        so re-running a search over an already indexed folder skips the
+        decode and hash work entirely.
+        """
+        cache_path = os.path.join(self.output_folder, self.CACHE_FILENAME)
+        cached = {}
+        try:
+            with np.load(cache_path) as data:
+                cached = dict(zip(data['keys'], data['hashes']))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A truncated or corrupt cache (e.g. the app was killed
+            # mid-save) degrades to a full rebuild, never a hard failure
+            print(f"Ignoring unreadable hash cache: {str(e)}")
+
+        total_files = len(full_paths)
+        hashes = np.zeros(total_files, dtype=np.uint64)
+        valid = np.zeros(total_files, dtype=bool)
+
+        keys = []
+        misses = []
+        for idx, path in enumerate(full_paths):
+            stat = os.stat(path)
+            key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+            keys.append(key)
+
+            if key in cached:
+                hashes[idx] = cached[key]
+                valid[idx] = True
+            else:
+                misses.append(idx)
+
+        # Hash only the misses, on a thread pool so disk reads and
+        # decoding overlap
+        if misses:
+            miss_paths = [full_paths[i] for i in misses]
+            results = self._executor.map(self.compute_phash, miss_paths, chunksize=4)
+
+            for done, (idx, h) in enumerate(zip(misses, results)):
+                if h is not None:
+                    hashes[idx] = h
+                    valid[idx] = True
+                    cached[keys[idx]] = hashes[idx]
+
+                # Update progress
+                progress = int((done + 1) / len(misses) * 100)
+                self.progress_updated.emit(progress)
+
+            try:
+                os.makedirs(self.output_folder, exist_ok=True)
+
+                # Write to a temp file and rename so an interrupted save
+                # can never leave a half-written cache behind
+                tmp_path = cache_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f,
+                             keys=np.array(list(cached.keys())),
+                             hashes=np.array(list(cached.values()), dtype=np.uint64))
+                os.replace(tmp_path, cache_path)
+            except (IOError, OSError) as e:
+                print(f"Error writing hash cache: {str(e)}")
+        else:
+            self.progress_updated.emit(100)
+
+        return hashes, valid
+
+    def _load_or_build_features(self, full_paths):
+        """Get the candidate feature matrix, memory-mapped on disk
+
+        Backing the matrix with np.memmap keeps folders larger than RAM
+        searchable - the matrix-vector product streams each row exactly
+        once - and a manifest of (absolute path, mtime_ns, size) keys
+        lets a repeat search over an unchanged folder reopen the built
+        matrix instead of re-indexing it.
+        """
+        total_files = len(full_paths)
+        dim = self.target_size[0] * self.target_size[1]
+        features_path = os.path.join(self.output_folder, self.FEATURES_FILENAME)
+        manifest_path = os.path.join(self.output_folder, self.MANIFEST_FILENAME)
+
+        keys = []
+        for path in full_paths:
+            stat = os.stat(path)
+            keys.append(f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}")
+        keys = np.array(keys)
+
+        # Reopen the existing matrix when the folder is unchanged
+        try:
+            with np.load(manifest_path) as manifest:
+                if np.array_equal(manifest['keys'], keys):
+                    X = np.memmap(features_path, dtype=np.float32, mode='r',
+                                  shape=(total_files, dim))
+                    valid = manifest['valid']
+                    tails = manifest['tails']
+                    self.progress_updated.emit(100)
+                    return X, valid, tails
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A truncated or corrupt manifest (e.g. the app was killed
+            # mid-save) degrades to a re-index, never a hard failure
+            print(f"Ignoring unreadable feature manifest: {str(e)}")
+
+        os.makedirs(self.output_folder, exist_ok=True)
+        X = np.memmap(features_path, dtype=np.float32, mode='w+',
+                      shape=(total_files, dim))
+        valid = np.zeros(total_files, dtype=bool)
+        nblocks = (dim + NCC_BLOCK - 1) // NCC_BLOCK
+        tails = np.zeros((total_files, nblocks), dtype=np.float32)
+
+        # Preprocess on the thread pool so disk reads and decoding overlap
+        # with the normalization work (cv2 releases the GIL in its kernels)
+        preprocessed = self._executor.map(self.preprocess_image, full_paths, chunksize=4)
+
+        for idx, current_img in enumerate(preprocessed):
+            if current_img is not None:
+                X[idx] = self._normalize(current_img)
+                tails[idx] = self._tail_norms(X[idx])
+                valid[idx] = True
+
+            # Update progress
+            progress = int((idx + 1) / total_files * 100)
+            self.progress_updated.emit(progress)
+
+        X.flush()
+        try:
+            # Write to a temp file and rename so an interrupted save can
+            # never leave a half-written manifest behind
+            tmp_path = manifest_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, keys=keys, valid=valid, tails=tails)
+            os.replace(tmp_path, manifest_path)
+        except (IOError, OSError) as e:
+            print(f"Error writing feature manifest: {str(e)}")
+
+        return X, valid, tails
 
     def preprocess_image(self, image_path):
         """Load and preprocess image for comparison"""
         try:
-            # Read image
-            img = cv2.imread(image_path)
+            # Decode straight to grayscale so the resize touches one
+            # channel instead of three
+            img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
             if img is None:
                 return None
-            
-            # Resize
-            img = cv2.resize(img, self.target_size)
-            
-            # Convert to grayscale for better comparison
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            
-            return gray
+
+            # Resize into a reused per-thread buffer instead of letting
+            # cv2 allocate a fresh array every call; preprocessing runs
+            # on the pool, so the scratch space is thread-local
+            buf = getattr(self._scratch, 'resize_buf', None)
+            if buf is None:
+                buf = np.empty((self.target_size[1], self.target_size[0]), dtype=np.uint8)
+                self._scratch.resize_buf = buf
+            cv2.resize(img, self.target_size, dst=buf, interpolation=cv2.INTER_AREA)
+
+            # Contiguous float32 copy so the similarity kernels can run
+            # on the buffer directly (and the scratch can be reused)
+            return buf.astype(np.float32)
         except Exception as e:
             self.error_occurred.emit(f"Error preprocessing image {image_path}: {str(e)}")
             return None
 
+    def _normalize(self, img):
+        """Flatten to a mean-centered, L2-normalized float32 vector"""
+        vec = img.astype(np.float32).ravel()
+        vec -= vec.mean()
+        vec /= (np.linalg.norm(vec) + 1e-8)
+        return vec
+
+    def _tail_norms(self, vec):
+        """Suffix L2 norms at NCC_BLOCK boundaries for the bounded kernel"""
+        suffix_sq = np.cumsum((vec * vec)[::-1])[::-1]
+        starts = np.arange(0, vec.size, NCC_BLOCK)
+        return np.sqrt(suffix_sq[starts]).astype(np.float32)
+
     def compute_similarity(self, img1, img2):
-        """Compute similarity between two images using multiple metrics"""
+        """Compute normalized cross-correlation between two images"""
         try:
-            # Compute structural similarity (SSIM)
-            score = cv2.matchTemplate(img1, img2, cv2.TM_CCOEFF_NORMED)[0][0]
-            
+            # Both images are the same size, so the closed-form NCC (one
+            # fused pass, or a BLAS dot product without numba) replaces
+            # the matchTemplate sliding search
+            a = self._query_norm if self._query_norm is not None else self._normalize(img1)
+            if NUMBA_AVAILABLE:
+                score = float(_ncc_kernel(a, img2.ravel()))
+            else:
+                score = float(a @ self._normalize(img2))
+
             # Normalize score to 0-1 range
             score = (score + 1) / 2
-            
+
             return score
         except Exception as e:
             self.error_occurred.emit(f"Error computing similarity: {str(e)}")
@@ -77,52 +387,263 @@ class ImageProcessor(QThread):
             self.error_occurred.emit(f"Error copying file: {str(e)}")
             return None
 
+    def _run_phash(self):
+        """Rank candidates by Hamming distance between perceptual hashes"""
+        query_hash = self.compute_phash(self.modified_image_path)
+        if query_hash is None:
+            raise Exception("Failed to load modified image")
+
+        full_paths = self._list_image_files()
+        total_files = len(full_paths)
+
+        if total_files == 0:
+            raise Exception("No supported images found in the folder")
+
+        hashes, valid = self._load_or_build_hashes(full_paths)
+
+        # One vectorized XOR + popcount pass over the whole folder
+        xor_bits = np.unpackbits((hashes ^ query_hash).view(np.uint8))
+        distances = xor_bits.reshape(total_files, 64).sum(axis=1)
+        scores = 1.0 - distances / 64.0
+
+        best_match = None
+        best_score = -1
+        pending = []
+        for idx, path in enumerate(full_paths):
+            if not valid[idx]:
+                continue
+
+            pending.append((os.path.basename(path), float(scores[idx])))
+            if len(pending) >= self.UPDATE_BATCH:
+                self.comparison_update.emit(pending)
+                pending = []
+
+        if pending:
+            self.comparison_update.emit(pending)
+
+        # One vectorized argmax pass instead of a Python branch per image
+        if valid.any():
+            best_idx = int(np.argmax(np.where(valid, scores, -1.0)))
+            best_score = float(scores[best_idx])
+            best_match = full_paths[best_idx]
+
+        return best_match, best_score
+
+    def _run_ncc(self):
+        """Rank candidates by pixel-wise normalized cross-correlation"""
+        # Load and preprocess modified image
+        modified_img = self.preprocess_image(self.modified_image_path)
+        if modified_img is None:
+            raise Exception("Failed to load modified image")
+
+        # Normalize the query once instead of per comparison
+        self._query_norm = self._normalize(modified_img)
+
+        # Get list of image files
+        full_paths = self._list_image_files()
+        total_files = len(full_paths)
+
+        if total_files == 0:
+            raise Exception("No supported images found in the folder")
+
+        X, valid, tails = self._load_or_build_features(full_paths)
+
+        best_match = None
+        best_score = -1.0  # Float, so _ncc_bounded reuses the warmed signature
+        pending = []
+
+        if NUMBA_AVAILABLE:
+            # The running best drives the early-exit bound, so the
+            # per-iteration tracking stays on this path
+            query_tails = self._tail_norms(self._query_norm)
+            for idx, path in enumerate(full_paths):
+                if not valid[idx]:
+                    continue
+
+                # Candidates that can no longer beat the running best
+                # bail out early and report 0.0
+                cos = _ncc_bounded(self._query_norm, np.asarray(X[idx]),
+                                   query_tails, tails[idx], best_score)
+                score = 0.0 if cos == -1.0 else float((cos + 1) / 2)
+                pending.append((os.path.basename(path), score))
+                if len(pending) >= self.UPDATE_BATCH:
+                    self.comparison_update.emit(pending)
+                    pending = []
+
+                if score > best_score:
+                    best_score = score
+                    best_match = full_paths[idx]
+        else:
+            # Single SGEMV over the whole corpus, mapped to the 0-1 range
+            scores = (X @ self._query_norm + 1) / 2
+
+            for idx, path in enumerate(full_paths):
+                if not valid[idx]:
+                    continue
+
+                pending.append((os.path.basename(path), float(scores[idx])))
+                if len(pending) >= self.UPDATE_BATCH:
+                    self.comparison_update.emit(pending)
+                    pending = []
+
+            # One vectorized argmax pass instead of a Python branch per image
+            if valid.any():
+                best_idx = int(np.argmax(np.where(valid, scores, -1.0)))
+                best_score = float(scores[best_idx])
+                best_match = full_paths[best_idx]
+
+        if pending:
+            self.comparison_update.emit(pending)
+
+        return best_match, best_score
+
+    def run(self):
+        """Main processing function"""
+        try:
+            if self.method == 'phash':
+                best_match, best_score = self._run_phash()
+            else:
+                best_match, best_score = self._run_ncc()
+
+            # Handle results
+            if best_match:
+                copied_path = self.copy_best_match(best_match)
+                if copied_path:
+                    self.result_found.emit(copied_path, best_score)
+                else:
+                    self.error_occurred.emit("Failed to copy best match")
+            else:
+                self.error_occurred.emit("No valid matches found")
+
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+class TorchImageProcessor(ImageProcessor):
+    """Torch-based processor that scores candidates in GPU batches"""
+
+    BATCH = 64
+
+    def __init__(self, executor=None):
+        super().__init__(executor)
+        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.transform = transforms.Compose([
+            transforms.Resize(self.target_size),
+            transforms.ToTensor(),
+            transforms.Normalize(mean=[0.485, 0.456, 0.406],
+                                 std=[0.229, 0.224, 0.225]),
+        ])
+        # Half precision on CUDA: cosine similarity is numerically safe
+        # at FP16 here, and it halves the bandwidth of every transfer
+        self._dtype = torch.float16 if self.device.type == 'cuda' else torch.float32
+        self._mean = torch.tensor([0.485, 0.456, 0.406], device=self.device,
+                                  dtype=self._dtype).view(3, 1, 1)
+        self._std = torch.tensor([0.229, 0.224, 0.225], device=self.device,
+                                 dtype=self._dtype).view(3, 1, 1)
+
+    def load_and_preprocess_image(self, image_path):
+        """Load and preprocess image into a tensor on the target device"""
+        try:
+            if self.device.type == 'cuda' and image_path.lower().endswith(('.jpg', '.jpeg')):
+                # nvJPEG decodes straight into GPU memory; resize and
+                # normalization stay on-device
+                img = decode_jpeg(read_file(image_path), mode=ImageReadMode.RGB,
+                                  device=self.device)
+                img = F.interpolate(img.unsqueeze(0).to(self._dtype), size=self.target_size,
+                                    mode='bilinear', align_corners=False).squeeze(0)
+                img = (img / 255.0 - self._mean) / self._std
+
+                # Unit-normalize here, once per image, so scoring needs
+                # no per-pair norms
+                return F.normalize(img.reshape(1, -1), dim=1).squeeze(0)
+
+            # Fall back to the CPU pipeline for other formats
+            img = Image.open(image_path).convert('RGB')
+            tensor = F.normalize(self.transform(img).reshape(1, -1), dim=1).squeeze(0)
+            if self.device.type == 'cuda':
+                tensor = tensor.pin_memory().to(self.device, non_blocking=True).to(self._dtype)
+            return tensor
+        except Exception as e:
+            self.error_occurred.emit(f"Error preprocessing image {image_path}: {str(e)}")
+            return None
+
+    def _search(self):
+        """Score every candidate in the folder against the query"""
+        # Load and preprocess modified image
+        modified_img_tensor = self.load_and_preprocess_image(self.modified_image_path)
+        if modified_img_tensor is None:
+            raise Exception("Failed to load modified image")
+
+        # Upload the query once; preprocessing already flattened and
+        # unit-normalized it, and every chunk reuses the device-resident
+        # vector
+        self._query_unit = modified_img_tensor.to(self.device)
+
+        # Get list of image files
+        full_paths = self._list_image_files()
+        total_files = len(full_paths)
+
+        if total_files == 0:
+            raise Exception("No supported images found in the folder")
+
+        all_paths = []
+        all_scores = []
+
+        # Preprocess on the thread pool while the main thread scores
+        # already-ready tensors in batches; the device sees one upload
+        # and one similarity kernel per chunk instead of one per image
+        preprocessed = self._executor.map(self.load_and_preprocess_image, full_paths, chunksize=4)
+
+        tensors = []
+        paths = []
+        for idx, (path, tensor) in enumerate(zip(full_paths, preprocessed)):
+            if tensor is not None:
+                tensors.append(tensor)
+                paths.append(path)
+
+            if len(tensors) == self.BATCH or idx == total_files - 1:
+                if tensors:
+                    # Rows and query are unit vectors, so the whole
+                    # chunk's cosine similarities are one cuBLAS
+                    # matrix-vector product
+                    batch = torch.stack(tensors).to(self.device, non_blocking=True)
+
+                    # The per-image copies were all issued non-blocking;
+                    # settle them once per chunk rather than per image
+                    if self.device.type == 'cuda':
+                        torch.cuda.current_stream().synchronize()
+
+                    scores = (batch @ self._query_unit).float().cpu().tolist()
+
+                    self.comparison_update.emit(
+                        [(os.path.basename(p), s) for p, s in zip(paths, scores)])
+
+                    all_paths.extend(paths)
+                    all_scores.extend(scores)
+
+                    tensors = []
+                    paths = []
+
+                # Update progress
+                progress = int((idx + 1) / total_files * 100)
+                self.progress_updated.emit(progress)
+
+        # One vectorized argmax pass instead of a Python branch per image
+        best_match = None
+        best_score = -1
+        if all_scores:
+            best_idx = int(np.argmax(np.asarray(all_scores)))
+            best_score = float(all_scores[best_idx])
+            best_match = all_paths[best_idx]
+
+        return best_match, best_score
+
     def run(self):
         """Main processing function"""
         try:
-            # Load and preprocess modified image
-            modified_img = self.preprocess_image(self.modified_image_path)
-            if modified_img is None:
-                raise Exception("Failed to load modified image")
-
-            best_match = None
-            best_score = -1
-            supported_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
-            
-            # Get list of image files
-            image_files = [f for f in os.listdir(self.folder_path) 
-                         if f.lower().endswith(supported_extensions)]
-            total_files = len(image_files)
-            
-            if total_files == 0:
-                raise Exception("No supported images found in the folder")
-            
-            # Process each image
-            for idx, filename in enumerate(image_files):
-                try:
-                    current_path = os.path.join(self.folder_path, filename)
-                    
-                    # Skip if it's the same file
-                    if os.path.abspath(current_path) == os.path.abspath(self.modified_image_path):
-                        continue
-                    
-                    # Process comparison image
-                    current_img = self.preprocess_image(current_path)
-                    if current_img is not None:
-                        score = self.compute_similarity(modified_img, current_img)
-                        self.comparison_update.emit(filename, score)
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_match = current_path
-                    
-                    # Update progress
-                    progress = int((idx + 1) / total_files * 100)
-                    self.progress_updated.emit(progress)
-                    
-                except Exception as e:
-                    print(f"Error processing {filename}: {str(e)}")
-                    continue
+            # The scoring path never needs gradients, so skip autograd's
+            # version counters and graph bookkeeping entirely
+            with torch.inference_mode():
+                best_match, best_score = self._search()
 
             # Handle results
             if best_match:
@@ -133,7 +654,7 @@ class ImageProcessor(QThread):
                     self.error_occurred.emit("Failed to copy best match")
             else:
                 self.error_occurred.emit("No valid matches found")
-                
+
         except Exception as e:
             self.error_occurred.emit(str(e))
 
@@ -144,7 +665,18 @@ class ImageFinderGUI(QMainWindow):
         if hasattr(QtWin, 'setCurrentProcessExplicitAppUserModelID'):
             QtWin.setCurrentProcessExplicitAppUserModelID('SearchByImage')
         self.initUI()
-        
+
+        # One long-lived processor and worker pool; repeat searches skip
+        # the CUDA context and thread pool startup cost
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        processor_cls = TorchImageProcessor if torch.cuda.is_available() else ImageProcessor
+        self.processor = processor_cls(executor=self.executor)
+        self.processor.progress_updated.connect(self.update_progress)
+        self.processor.result_found.connect(self.show_best_match)
+        self.processor.comparison_update.connect(self.add_comparison_result)
+        self.processor.error_occurred.connect(self.show_error)
+        self.processor.finished.connect(self.search_finished)
+
     def initUI(self):
         """Initialize the user interface"""
         self.setWindowTitle('Search by Image')
@@ -250,25 +782,25 @@ class ImageFinderGUI(QMainWindow):
         self.results_table.setRowCount(0)
         self.progress_bar.setValue(0)
         self.btn_search.setEnabled(False)
-        
-        self.processor = ImageProcessor(self.modified_image_path, self.folder_path, self.output_folder)
-        self.processor.progress_updated.connect(self.update_progress)
-        self.processor.result_found.connect(self.show_best_match)
-        self.processor.comparison_update.connect(self.add_comparison_result)
-        self.processor.error_occurred.connect(self.show_error)
-        self.processor.finished.connect(self.search_finished)
+
+        self.processor.configure(self.modified_image_path, self.folder_path, self.output_folder)
         self.processor.start()
 
     def update_progress(self, value):
         """Update progress bar value"""
         self.progress_bar.setValue(value)
 
-    def add_comparison_result(self, filename, score):
-        """Add a new comparison result to the table"""
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
-        self.results_table.setItem(row, 0, QTableWidgetItem(filename))
-        self.results_table.setItem(row, 1, QTableWidgetItem(f"{score:.4f}"))
+    def add_comparison_result(self, results):
+        """Add a batch of comparison results to the table"""
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            row = self.results_table.rowCount()
+            self.results_table.setRowCount(row + len(results))
+            for offset, (filename, score) in enumerate(results):
+                self.results_table.setItem(row + offset, 0, QTableWidgetItem(filename))
+                self.results_table.setItem(row + offset, 1, QTableWidgetItem(f"{score:.4f}"))
+        finally:
+            self.results_table.setUpdatesEnabled(True)
 
     def show_best_match(self, path, score):
         """Display the best matching image path and score"""